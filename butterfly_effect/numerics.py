@@ -1,5 +1,6 @@
 from numpy import sin, cos, exp, array, pi
 from scipy.integrate import solve_ivp
+from functools import cache
 
 # PHYSICAL CONSTANTS
 l = 2.0
@@ -14,6 +15,14 @@ class DoublePendelumNumerics():
     def __init__(self, theta_0=0.0, theta_dot_0=0.0, phi_0=0.0, phi_dot_0=0.0, sim_time=10.0):
         self.y0 = array([theta_0, theta_dot_0, phi_0, phi_dot_0])
         self.compute_solution(sim_time)
+
+    @classmethod
+    @cache
+    def get_numerics(cls, theta_0, phi_0, sim_time):
+        '''
+        Solution for initial angles [theta_0] and [phi_0], computed once per set of parameters.
+        '''
+        return cls(theta_0=theta_0, phi_0=phi_0, sim_time=sim_time)
     
     def get_ode_rhs(self, t, y):
         # unpack
@@ -1,5 +1,8 @@
 from config import *
+import zlib
 from numerics import *
+from common.sampling import *
+from common.dry_run import *
 
 
 # CUSTOM MOBJECTS
@@ -19,42 +22,79 @@ class DoublePendelum(VGroup):
         super().__init__(first_line, first_dot, second_line, second_dot)
         self.set_color(color)
 
-class MotionTracker(ParametricFunction):
-    def __init__(self, theta, phi, t_end, **kwargs):
+    def get_bobs(self):
+        return array([self[1].get_center(), self[3].get_center()])
+
+class MotionTracker(AdaptiveParametricFunction):
+    def __init__(self, angles, t_end, **kwargs):
         delta_t = 1.5
         t_start = t_end - delta_t if t_end > delta_t else 0.0
         super().__init__(
-            lambda t: ax.c2p(l * sin(theta(t)) + l * sin(phi(t)), - l * cos(theta(t)) - l * cos(phi(t))),
+            lambda t: self.get_end_point(*angles(t)),
             t_range=(t_start, t_end),
             **kwargs
         )
 
+    @staticmethod
+    def get_end_point(theta, phi):
+        return ax.c2p(l * sin(theta) + l * sin(phi), - l * cos(theta) - l * cos(phi))
+
 class DynamicDoublePendelum(VGroup):
+    '''
+    Double pendelum with motion tracker following ValueTracker [t]. The ODE solution is not stored on the
+    mobject; manim's scene caching sees it through content_hash instead.
+    '''
     def __init__(self, t, theta_0, phi_0, sim_time, color):
         super().__init__()
-        self.compute_solution(theta_0, phi_0, sim_time)
-        self.add_pendelum(t, color)
-        self.add_tracker(t, color)
-    
-    def compute_solution(self, theta_0, phi_0, sim_time):
-        self.numerics = DoublePendelumNumerics(theta_0=theta_0, phi_0=phi_0, sim_time=sim_time)
-        self.theta = self.numerics.get_theta_solution()
-        self.phi = self.numerics.get_phi_solution()
-
-    def add_pendelum(self, t, color):
-        self.pendelum = DoublePendelum(self.theta(t.get_value()), self.phi(t.get_value()), color=color)
-        self.pendelum.add_updater(lambda mob: mob.become(
-            DoublePendelum(self.theta(t.get_value()), self.phi(t.get_value()), color=color)  
-        ))
+        self.t = t
+        self.theta_0 = theta_0
+        self.phi_0 = phi_0
+        self.sim_time = sim_time
+        self.pendelum_color = color
+        self.content_hash = self.get_content_hash()
+        self.add_pendelum()
+        self.add_tracker()
+
+    def __deepcopy__(self, clone_from_id):
+        # copies follow the same ValueTracker instead of a clone of it
+        clone_from_id[id(self.t)] = self.t
+        return super().__deepcopy__(clone_from_id)
+
+    def get_content_hash(self):
+        '''
+        Hash of the parameters and of the solution sampled over the whole tracker range [0, sim_time], so edits
+        to the numerics change it even while the pendelum still sits at its initial angles.
+        '''
+        samples = self.get_numerics().solution(np.linspace(0.0, self.sim_time, 65))
+        parameters = repr((self.theta_0, self.phi_0, self.sim_time, self.pendelum_color, l, g))
+        return zlib.crc32(parameters.encode() + samples.tobytes())
+
+    def get_numerics(self):
+        return DoublePendelumNumerics.get_numerics(self.theta_0, self.phi_0, self.sim_time)
+
+    def angles(self, time):
+        '''
+        Angles theta and phi at [time] from a single evaluation of the dense solution.
+        '''
+        theta, theta_dot, phi, phi_dot = self.get_numerics().solution(time)
+        return float(theta), float(phi)
+
+    def add_pendelum(self):
+        self.pendelum = DoublePendelum(*self.angles(self.t.get_value()), color=self.pendelum_color)
+        self.pendelum.add_updater(self.update_pendelum)
         self += self.pendelum
 
-    def add_tracker(self, t, color):
-        self.tracker = MotionTracker(self.theta, self.phi, t.get_value(), color=color)
-        self.tracker.add_updater(lambda mob: mob.become(
-            MotionTracker(self.theta, self.phi, t.get_value(), color=color)
-        ))
+    def update_pendelum(self, mob):
+        mob.become(DoublePendelum(*self.angles(self.t.get_value()), color=self.pendelum_color))
+
+    def add_tracker(self):
+        self.tracker = MotionTracker(self.angles, self.t.get_value(), color=self.pendelum_color)
+        self.tracker.add_updater(self.update_tracker)
         self += self.tracker
 
+    def update_tracker(self, mob):
+        mob.become(MotionTracker(self.angles, self.t.get_value(), color=self.pendelum_color))
+
 # parameters
 sim_time = 32.0
 epsilon = 0.05
@@ -86,8 +126,20 @@ title = Tex(r"\textbf{$\mathbb{B}$", r"utterfly effect.}", height=0.7).move_to(5
 title[0].set_color(title_color)
 
 # SCENE
-class ButterflyEffectScene(Scene):
+class ButterflyEffectScene(DryRun, Scene):
+    def get_frame_state(self):
+        return {
+            't': self.t.get_value(),
+            'first_angles': self.first_pendelum.angles(self.t.get_value()),
+            'second_angles': self.second_pendelum.angles(self.t.get_value()),
+            'first_bobs': self.first_pendelum.pendelum.get_bobs(),
+            'second_bobs': self.second_pendelum.pendelum.get_bobs(),
+        }
+
     def construct(self):
+        self.t = t
+        self.first_pendelum = first_dynamic_pendelum
+        self.second_pendelum = second_dynamic_pendelum
         self.add(ax, first_dynamic_pendelum, first_dynamic_pendelum_copy, title)
         self.play(ReplacementTransform(first_dynamic_pendelum_copy, second_dynamic_pendelum))
         self.play(t.animate.set_value(sim_time), run_time=sim_time, rate_func=linear)
@@ -0,0 +1,68 @@
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+import numpy as np
+
+
+class DryRunRenderer(CairoRenderer):
+    '''
+    Renderer for manim's --dry_run flag. The scene clock advances at the frame rate and all animations and
+    updaters run as usual, but no frame is rasterized or written. Instead the state returned by the scene's
+    get_frame_state is recorded every frame and saved to <media_dir>/dry_run/<scene>.npz.
+    '''
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.frame_times = []
+        self.frame_states = []
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.scene = scene
+        # the scene's camera class (e.g. ThreeDCamera) is only known once the scene is set up
+        if type(self.camera) is not scene.camera_class:
+            self.camera = scene.camera_class()
+
+    def update_frame(self, scene, mobjects=None, **kwargs):
+        pass
+
+    def get_frame(self):
+        return None
+
+    def add_frame(self, frame, num_frames=1):
+        if self.skip_animations:
+            return
+        dt = 1 / self.camera.frame_rate
+        state = self.scene.get_frame_state()
+        for _ in range(num_frames):
+            self.frame_times.append(self.time)
+            self.frame_states.append(state)
+            self.time += dt
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        self.save_frame_states(scene)
+
+    def save_frame_states(self, scene):
+        path = config.get_dir("media_dir") / "dry_run" / f"{type(scene).__name__}.npz"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        keys = self.frame_states[0].keys() if self.frame_states else []
+        np.savez_compressed(
+            path,
+            time=np.array(self.frame_times),
+            **{key: np.array([state[key] for state in self.frame_states]) for key in keys},
+        )
+        logger.info(f"Dry run: saved {len(self.frame_times)} frames to {path}")
+
+
+class DryRun():
+    '''
+    Scene mixin which switches to the DryRunRenderer when manim is called with --dry_run.
+    Scenes override get_frame_state to choose what is recorded.
+    '''
+    def __init__(self, **kwargs):
+        if config.dry_run:
+            config.disable_caching = True   # nothing is written, so nothing can be looked up either
+            kwargs.setdefault('renderer', DryRunRenderer(skip_animations=kwargs.get('skip_animations', False)))
+        super().__init__(**kwargs)
+
+    def get_frame_state(self):
+        return {}
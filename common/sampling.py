@@ -0,0 +1,57 @@
+from manim import *
+import numpy as np
+
+
+def get_adaptive_samples(function, t_min, t_max, tolerance, base_samples=16, max_depth=10):
+    '''
+    Parameter values for curve [function] on [t_min, t_max]. Intervals are bisected until the midpoint of the
+    curve deviates less than [tolerance] from the chord, so flat parts get few samples and sharp bends many.
+    '''
+    if t_max <= t_min:
+        return np.array([t_min]), np.array([function(t_min)])
+    min_step = (t_max - t_min) / (base_samples * 2**max_depth)
+    ts = list(np.linspace(t_min, t_max, base_samples + 1))
+    points = [np.asarray(function(t)) for t in ts]
+
+    # bisect intervals whose midpoint deviates from the chord
+    i = 0
+    while i < len(ts) - 1:
+        t = (ts[i] + ts[i + 1]) / 2
+        point = np.asarray(function(t))
+        if ts[i + 1] - ts[i] > min_step and get_chord_error(points[i], point, points[i + 1]) > tolerance:
+            ts.insert(i + 1, t)
+            points.insert(i + 1, point)
+        else:
+            i += 1
+    return np.array(ts), np.array(points)
+
+
+def get_chord_error(start, point, end):
+    '''
+    Distance of [point] from the line segment between [start] and [end].
+    '''
+    chord = end - start
+    length = np.dot(chord, chord)
+    if length == 0:
+        return np.linalg.norm(point - start)
+    s = np.clip(np.dot(point - start, chord) / length, 0, 1)
+    return np.linalg.norm(point - start - s * chord)
+
+
+class AdaptiveParametricFunction(ParametricFunction):
+    '''
+    ParametricFunction sampled adaptively up to a screen-space error of [pixel_tolerance] pixels.
+    '''
+    def __init__(self, function, t_range=(0, 1), pixel_tolerance=0.5, **kwargs):
+        self.tolerance = pixel_tolerance * config.frame_width / config.pixel_width
+        super().__init__(function, t_range=t_range, **kwargs)
+
+    def generate_points(self):
+        ts, points = get_adaptive_samples(self.function, self.t_min, self.t_max, self.tolerance)
+        self.start_new_path(points[0])
+        self.add_points_as_corners(points[1:])
+        if self.use_smoothing:
+            self.make_smooth()
+        return self
+
+    init_points = generate_points
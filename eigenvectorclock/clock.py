@@ -1,10 +1,18 @@
 from config import *
+import zlib
+from common.sampling import *
+from common.dry_run import *
 
 class EigenClock(VGroup):
+    '''
+    Vector v and A v at angle [theta] with the arcs they traced.
+    '''
     def __init__(self, A, theta):
         super().__init__()
         self.A = A
         self.theta = theta
+        self.tracker = None
+        self.content_hash = self.get_content_hash()
 
         self.vector = Arrow(start=ax.c2p(0, 0), end=ax.c2p(*self.get_vector(self.theta)), buff=0.0, color=vector_color)
         self.matrix_vector = Arrow(start=ax.c2p(0, 0), end=ax.c2p(*self.get_matrix_vector(self.theta)), buff=0.0, color=matrix_color)
@@ -14,8 +22,20 @@ class EigenClock(VGroup):
         self += self.get_label(self.vector, "v").set_color(vector_color)
         self += self.get_label(self.matrix_vector, "A v").set_color(matrix_color)
 
-        self += ParametricFunction(lambda phi: ax.c2p(*self.get_vector(phi)), t_range=(0, self.theta), color=vector_color)
-        self += ParametricFunction(lambda phi: ax.c2p(*self.get_matrix_vector(phi)), t_range=(0, self.theta), color=matrix_color)
+        self += AdaptiveParametricFunction(lambda phi: ax.c2p(*self.get_vector(phi)), t_range=(0, self.theta), color=vector_color)
+        self += AdaptiveParametricFunction(lambda phi: ax.c2p(*self.get_matrix_vector(phi)), t_range=(0, self.theta), color=matrix_color)
+
+    def __deepcopy__(self, clone_from_id):
+        # copies follow the same ValueTracker instead of a clone of it
+        if self.tracker is not None:
+            clone_from_id[id(self.tracker)] = self.tracker
+        return super().__deepcopy__(clone_from_id)
+
+    def get_content_hash(self):
+        '''
+        Hash of the matrix and the angle, picked up by manim's scene caching.
+        '''
+        return zlib.crc32(repr((float(self.theta), self.A.tolist())).encode())
 
     def get_vector(self, theta):
         return cos(theta), sin(theta)
@@ -38,6 +58,20 @@ class EigenClock(VGroup):
         label = MathTex(abs_eigenvalue, color=eigen_color).next_to(double_arrow.get_center(), direction, buff=0.1)
         return VGroup(double_arrow, label)
 
+    def follow(self, tracker):
+        '''
+        Turn the clock with ValueTracker [tracker]. The updater is a method, so manim's scene caching
+        hashes the matrix and the tracker instead of a closure.
+        '''
+        self.tracker = tracker
+        self.add_updater(self.update_angle)
+        return self
+
+    def update_angle(self, mob):
+        # become each part on its own: VGroup.become would align every arc to its largest point count so far
+        for part, new_part in zip(mob.submobjects, EigenClock(self.A, self.tracker.get_value()).submobjects):
+            part.become(new_part)
+
 
 vector_color = "#74ee15"     # green
 matrix_color = "#f000ff"     # pink
@@ -61,16 +95,24 @@ A = array([
 
 theta = ValueTracker(0.0)
 
-clock = EigenClock(A, theta.get_value())
-clock.add_updater(lambda mob: mob.become(EigenClock(A, theta.get_value())))
+clock = EigenClock(A, theta.get_value()).follow(theta)
 
 degrees = [45*DEGREES, 135*DEGREES, 225*DEGREES, 315*DEGREES]
 abs_eigenvalues = ["2", "1", "2", "1"]
 eigenvalues = ["2", "-", "2", "-"]
 run_times = [2.5, 2.0, 1.5, 1.5]
 
-class EigenVectorClockScene(Scene):
+class EigenVectorClockScene(DryRun, Scene):
+    def get_frame_state(self):
+        return {
+            'theta': self.theta.get_value(),
+            'vector': self.clock.vector.get_end(),
+            'matrix_vector': self.clock.matrix_vector.get_end(),
+        }
+
     def construct(self):
+        self.theta = theta
+        self.clock = clock
         self.play(Write(title, run_time=1.0), FadeIn(ax, run_time=1.5), Create(clock))
         
         for degree, abs_eigenvalue, eigenvalue, run_time in zip(degrees, abs_eigenvalues, eigenvalues, run_times):
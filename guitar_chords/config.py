@@ -1,7 +1,11 @@
 from manim import *
-from scipy import integrate
+import sys
+from pathlib import Path
 from numpy import sin, cos, exp, array
 
+# shared modules in common/ next to the reel folders
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
 # set up portrait mode
 config.frame_width = 9
 config.frame_height = 16
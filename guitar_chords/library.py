@@ -0,0 +1,99 @@
+import csv
+from pathlib import Path
+import numpy as np
+from numpy import sin, pi, array
+
+STRINGS = ['E', 'A', 'D', 'G', 'B', 'e']
+SEMITONES = array([0, 5, 10, 15, 19, 24])   # tuning of the strings relative to low E
+WRITTEN_PITCHES = 52 + SEMITONES            # open strings in guitar notation (E3 to E5) as midi numbers
+NOTE_STEPS = [0, 0, 1, 1, 2, 3, 3, 4, 4, 5, 5, 6]   # staff step of each pitch class, spelled with sharps
+SHARPS = [False, True, False, True, False, False, True, False, True, False, True, False]
+
+
+def get_table_dtype(order):
+    '''
+    One row per chord, one column per string.
+    '''
+    return np.dtype([
+        ('fret', np.int8, 6),               # -1 for muted strings
+        ('played', np.bool_, 6),
+        ('length', np.float64, 6),          # effective length between fret and bridge
+        ('speed', np.float64, 6),           # propagation speed c
+        ('frequency', np.float64, 6),       # fundamental c / 2L
+        ('fourier', np.float64, (6, order)),
+    ])
+
+
+def precompute_strings(frets, L, d, c=1.0, m=1.0, order=1):
+    '''
+    Table of strings of scale length [L] for chords with [frets] (shape (n, 6), -1 for muted strings). Every
+    string is plucked with maximum [m] at distance [d] from the bridge, low E has propagation speed [c].
+    The fourier coefficients of the triangular initial deflection are computed in closed form.
+    '''
+    frets = np.atleast_2d(frets)
+    table = np.zeros(len(frets), dtype=get_table_dtype(order))
+    length = L * 2**( - np.maximum(frets, 0) / 12 )
+    a = length - d                          # pluck position
+    k = np.arange(1, order + 1)
+    table['fret'] = frets
+    table['played'] = frets >= 0
+    table['length'] = length
+    table['speed'] = c * 2**( SEMITONES / 12 )
+    table['frequency'] = table['speed'] / ( 2 * length )
+    table['fourier'] = (
+        2 * m * length[..., None]**2 * sin( pi * k * a[..., None] / length[..., None] )
+        / ( k**2 * pi**2 * a[..., None] * d )
+    )
+    return table
+
+
+class ChordLibrary():
+    '''
+    Chord catalogue loaded from [path]. Each row holds name, label and the frets of the six strings (x for
+    muted). Besides the open chords, voicings are named <chord>@<fret> after the fret of their root.
+    '''
+    def __init__(self, path=Path(__file__).with_name('chords.csv')):
+        with open(path, newline='') as file:
+            rows = list(csv.DictReader(file))
+        self.names = [row['name'] for row in rows]
+        self.labels = [row['label'] for row in rows]
+        self.frets = array([
+            [-1 if row[letter] == 'x' else int(row[letter]) for letter in STRINGS] for row in rows
+        ], dtype=np.int8)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.tables = {}
+
+    def precompute(self, L, d, c=1.0, m=1.0, order=1):
+        '''
+        String table of all chords, computed once per set of parameters.
+        '''
+        key = (L, d, c, m, order)
+        if key not in self.tables:
+            self.tables[key] = precompute_strings(self.frets, L, d, c=c, m=m, order=order)
+        return self.tables[key]
+
+    def get_strings(self, name, L, d, **kwargs):
+        return self.precompute(L, d, **kwargs)[self.index[name]]
+
+    def get_notes(self, name):
+        '''
+        Staff positions of the notes of chord [name] (bottom line at 0) with ledger lines, label and sharps.
+        '''
+        i = self.index[name]
+        note_dict = {}
+        hashtags = []
+        for letter, pitch, fret in zip(STRINGS, WRITTEN_PITCHES, self.frets[i]):
+            if fret < 0:
+                continue
+            octave, pitch_class = divmod(int(pitch + fret), 12)
+            position = 0.5 * ( 7 * octave + NOTE_STEPS[pitch_class] - 30 ) - 3.5
+            note_dict[letter] = position
+            if SHARPS[pitch_class]:
+                hashtags.append(position)
+        lowest, highest = min(note_dict.values()), max(note_dict.values())
+        aux_lines = [float(line) for line in range(-1, int(np.ceil(lowest)) - 1, -1)]
+        aux_lines += [float(line) for line in range(5, int(np.floor(highest)) + 1)]
+        return note_dict, aux_lines, self.labels[i], hashtags
+
+
+chord_library = ChordLibrary()
@@ -1,4 +1,8 @@
 from config import *
+import zlib
+from common.sampling import *
+from library import *
+from common.dry_run import *
 
 # colors
 color_E = "#fe0000"     # red
@@ -23,39 +27,14 @@ labels = ax.get_axis_labels(
 class StringMath():
     '''
     Math for guitar string of length [L] and propagation speed [c]. Computes solution of wave equation
-    with initial deflection [initial_func] using a fourierseries of order [order].
+    from the fourier coefficients [fourier_coeff] of the initial deflection, precomputed by the chord library.
     '''
-    def __init__(self, initial_func, L=PI, c=1.0, order=1, gamma=0.0):
-        self.initial_func = initial_func
+    def __init__(self, fourier_coeff, L=PI, c=1.0, gamma=0.0):
+        self.fourier_coeff = fourier_coeff
         self.L = L
         self.c = c
-        self.order = order
+        self.order = len(fourier_coeff)
         self.gamma = gamma
-        self.fourier_coeff = self.compute_fourier_coeff()
-
-    def compute_fourier_coeff(self):
-        coefficients = {}
-        for k in range(1, self.order + 1):
-            coefficients[k] = ( 2 / self.L ) * integrate.quad(lambda x: sin( PI * k * x / self.L ) * self.initial_func(x), 0, self.L)[0]
-        return coefficients
-
-    @classmethod
-    def get_string(cls, d, m=1.0, L=PI, c=1.0, order=1, gamma=0.0):
-        '''
-        Construcs string with displacement [d] from the right side. [m] is the maximum of the displacement.
-        '''
-        initial_func_1 = lambda x: m * x / ( L - d ) if x <= L - d else - ( m / d ) * ( x - L ) 
-        eps = 0.2 * L 
-        def initial_func_2(x):
-            if x <= L - d - eps:
-                return 0
-            elif L - d - eps < x <= L - d:
-                return m * ( x - ( L - d - eps ) ) / eps
-            elif L - d < x <= L - d + eps:
-                return - ( m / eps ) * x + ( m / eps ) * ( L - d + eps )
-            else:
-                return 0
-        return cls(initial_func_1, L=L, c=c, order=order, gamma=gamma)
 
     def get_function(self, t=0.0):
         '''
@@ -69,71 +48,38 @@ class StringMath():
 
 class ChordMath():
     '''
-    Construct chords from fret dictionary [fret_dict].
+    Construct chords from a row [strings] of the precomputed string table of the chord library.
     '''
-    def __init__(self, fret_dict, L, d, c=1.0, order=1, m=1.0, gamma=0.0):
+    def __init__(self, strings, L, gamma=0.0):
         self.L = L
-        self.fret_dict = fret_dict
-        c_dict = {
-            'E' : c,
-            'A' : 2**( 5 / 12 ) * c,
-            'D' : 2**( 10 / 12 ) * c,
-            'G' : 2**( 15 / 12 ) * c,
-            'B' : 2**( 19 / 12 ) * c,
-            'e' : 2**( 24 / 12 ) * c
+        self.fret_dict = {
+            letter: int(fret) for letter, fret, played in zip(STRINGS, strings['fret'], strings['played']) if played
         }
-        string_dict = {
-            letter: StringMath.get_string(
-                d, 
-                m=m, 
-                L=L - self.get_fret(fret_dict[letter]), 
-                c=c_dict[letter], 
-                order=order,
+        self.string_dict = {
+            letter: StringMath(
+                {k: coeff for k, coeff in enumerate(fourier, start=1)},
+                L=length,
+                c=speed,
                 gamma=gamma,
-            ) for letter in fret_dict
+            ) for letter, length, speed, fourier, played in zip(
+                STRINGS, strings['length'], strings['speed'], strings['fourier'], strings['played']
+            ) if played
         }
-        self.string_dict = string_dict
     
     def get_fret(self, n): # positon of [n]-th fret
         return self.L * ( 1 - 2**( - n / 12 ) )
 
+    @classmethod
+    def from_frets(cls, fret_dict, L, d, c=1.0, order=1, m=1.0, gamma=0.0):
+        '''
+        Construct chord outside the library from fret dictionary [fret_dict].
+        '''
+        frets = [fret_dict.get(letter, -1) for letter in STRINGS]
+        return cls(precompute_strings(frets, L, d, c=c, m=m, order=order)[0], L, gamma=gamma)
+
     @classmethod 
-    def get_chord(cls, name, L, d, **kwargs):
-        match name:
-            case 'Em':
-                fret_dict = {
-                    'E' : 0,
-                    'A' : 2,
-                    'D' : 2,
-                    'G' : 0,
-                    'B' : 0,
-                    'e' : 0,
-                }
-            case 'G':
-                fret_dict = {
-                    'E' : 3,
-                    'A' : 2,
-                    'D' : 0,
-                    'G' : 0,
-                    'B' : 0,
-                    'e' : 3,
-                }
-            case 'D':
-                fret_dict = {
-                    'D' : 0,
-                    'G' : 2,
-                    'B' : 3,
-                    'e' : 2,
-                }
-            case 'A':
-                fret_dict = {
-                    'A' : 0,
-                    'D' : 2,
-                    'G' : 2,
-                    'B' : 2,
-                    'e' : 0,
-                }
-        return cls(fret_dict, L, d, **kwargs)
+    def get_chord(cls, name, L, d, c=1.0, order=1, m=1.0, gamma=0.0):
+        return cls(chord_library.get_strings(name, L, d, c=c, m=m, order=order), L, gamma=gamma)
 
 
 class ChordVisual(VGroup):
@@ -142,6 +88,10 @@ class ChordVisual(VGroup):
     '''
     def __init__(self, chord, t=0.0):
         super().__init__()
+        self.chord = chord
+        self.t = t
+        self.tracker = None
+        self.content_hash = self.get_content_hash()
         color_dict = {
             'E' : color_E,
             'A' : color_A,
@@ -159,7 +109,7 @@ class ChordVisual(VGroup):
             string_length = chord.L
             function = lambda x: string.get_function(t=t)(x - fret_location)
             self += Dot(ax.c2p(fret_location, 0, z), fill_opacity=1.0, color=color_dict[letter], radius=0.06).rotate(90 * DEGREES, RIGHT)
-            self += ParametricFunction(
+            self += AdaptiveParametricFunction(
                 lambda t: ax.c2p(t, function(t), z), 
                 t_range=(fret_location, string_length), 
                 color=color_dict[letter]
@@ -167,6 +117,48 @@ class ChordVisual(VGroup):
             self += Dot(ax.c2p(string_length, 0, z), fill_opacity=1.0, color=color_dict[letter], radius=0.06).rotate(90 * DEGREES, RIGHT)
             z -= delta
 
+    def __deepcopy__(self, clone_from_id):
+        # copies follow the same ValueTracker instead of a clone of it
+        if self.tracker is not None:
+            clone_from_id[id(self.tracker)] = self.tracker
+        return super().__deepcopy__(clone_from_id)
+
+    def get_content_hash(self):
+        '''
+        Hash of the frets and the string parameters of the chord, picked up by manim's scene caching.
+        '''
+        strings = [
+            (letter, self.chord.fret_dict[letter], string.L, string.c, string.gamma, tuple(string.fourier_coeff.values()))
+            for letter, string in self.chord.string_dict.items()
+        ]
+        return zlib.crc32(repr((self.chord.L, strings)).encode())
+
+    def follow(self, tracker):
+        '''
+        Let the strings vibrate with ValueTracker [tracker]. The updater is a method, so manim's scene caching
+        hashes the chord and the tracker instead of a closure.
+        '''
+        self.tracker = tracker
+        self.add_updater(self.update_strings)
+        return self
+
+    def update_strings(self, mob):
+        # become each part on its own: VGroup.become would align every string to its largest point count so far
+        for part, new_part in zip(mob.submobjects, ChordVisual(self.chord, t=self.tracker.get_value()).submobjects):
+            part.become(new_part)
+        mob.t = self.tracker.get_value()
+
+    def get_displacements(self, samples=64):
+        '''
+        Displacement of the six strings at [samples] points from fret to bridge, nan for muted strings.
+        '''
+        displacements = np.full((len(STRINGS), samples), np.nan)
+        for i, letter in enumerate(STRINGS):
+            if letter in self.chord.string_dict:
+                string = self.chord.string_dict[letter]
+                displacements[i] = string.get_function(t=self.t)(np.linspace(0, string.L, samples))
+        return displacements
+
 class ChordNotes(VGroup):
     '''
     Show notes in dictionary [note_dict] with sharps indicated in the list [hashtags].
@@ -196,58 +188,18 @@ class ChordNotes(VGroup):
 
     @classmethod
     def get_chord(cls, name):
-        match name:
-            case 'Em':
-                note_dict = {
-                    'E' : -3.5,
-                    'A' : -1.5,
-                    'D' : 0.0,
-                    'G' : 1.0,
-                    'B' : 2.0, 
-                    'e' : 3.5,
-                }
-                aux_lines = [-1.0, -2.0, -3.0]
-                label = "E minor"
-                hashtags = []
-            case 'G':
-                note_dict = {
-                    'E' : -2.5,
-                    'A' : -1.5,
-                    'D' : -0.5,
-                    'G' : 1.0,
-                    'B' : 2.0,
-                    'e' : 4.5,
-                }
-                aux_lines = [-1.0, -2.0]
-                label = 'G major'
-                hashtags = []
-            case 'D':
-                note_dict = {
-                    'D' : -0.5,
-                    'G' : 1.5,
-                    'B' : 3.0,
-                    'e' : 4.0
-                }
-                aux_lines = []
-                label = 'D major'
-                hashtags = [4.0]
-            case 'A':
-                note_dict = {
-                    'A' : -2.0,
-                    'D' : 0.0,
-                    'G' : 1.5,
-                    'B' : 2.5,
-                    'e' : 3.5,
-                }
-                aux_lines = [-1.0, -2.0]
-                label = 'A major'
-                hashtags = [2.5]
-        return cls(note_dict, aux_lines, label, hashtags)
+        return cls(*chord_library.get_notes(name))
 
-class Music(ThreeDScene):
+class Music(DryRun, ThreeDScene):
     '''
     Animate guitar chords.
     '''
+    def get_frame_state(self):
+        return {
+            't': self.t.get_value(),
+            'strings': self.visual.get_displacements(),
+        }
+
     def construct(self):
         L = 4.0
         d = 0.5
@@ -261,13 +213,12 @@ class Music(ThreeDScene):
         sheet = ImageMobject("music_sheet.png").scale(0.35).shift(4*DOWN)
 
         t = ValueTracker(0.0)
+        self.t = t
 
         math = ChordMath.get_chord('Em', L, d, order=order, c=c, m=m, gamma=gamma)
-        visual = ChordVisual(math)
+        visual = ChordVisual(math).follow(t)
+        self.visual = visual
         notes = ChordNotes.get_chord('Em')
-        visual.add_updater(lambda mob: mob.become(
-            ChordVisual(math, t=t.get_value())    
-        ))
         self.set_camera_orientation(phi=60*DEGREES, theta=-175*DEGREES)
         self.begin_ambient_camera_rotation(rate=0.175)
         self.add_fixed_in_frame_mobjects(title, sheet, notes)
@@ -289,11 +240,10 @@ class Music(ThreeDScene):
                 ReplacementTransform(visual, next_visual, run_time=2.0), 
                 Create(next_notes, run_time=1.0),
             )
+            self.visual = next_visual
             self.wait(0.5)
             t.set_value(0.0)
-            next_visual.add_updater(lambda mob: mob.become(
-                ChordVisual(next_math, t=t.get_value())
-            ))
+            next_visual.follow(t)
             self.play(t.animate(run_time=sim_time).set_value(sim_time), rate_func=linear)
             self.play(FadeOut(next_notes, run_time=0.5))
             next_visual.clear_updaters()